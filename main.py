@@ -6,12 +6,16 @@ Controls your computer mouse using hand gestures detected via webcam.
 """
 
 import cv2
-from src.camera import initialize_camera
-from src.hand_detector import HandDetector
+from src.camera import initialize_camera, LatestFrameGrabber
+from src.hand_detector import HandDetector, ThreadedHandDetector
 from src.mouse_controller import MouseController
 from src.gesture_handler import GestureHandler
-from src.utils import FPSCounter
-from src.config import WINDOW_TITLE
+from src.utils import FPSCounter, FrameLimiter
+from src.config import (
+    WINDOW_TITLE, HAND_LANDMARKER_MODEL_PATH, HAND_MODEL_COMPLEXITY,
+    HAND_DETECTION_DELEGATE, INFERENCE_SCALE, USE_OPENCL, TARGET_FPS,
+    DEBUG_DRAW, THREADED_DETECTION, NO_HAND_IDLE_FRAMES, NO_HAND_DETECTION_INTERVAL
+)
 
 
 def main():
@@ -21,13 +25,29 @@ def main():
     """
     # Initialize camera
     print("Initializing camera...")
-    cap = initialize_camera()
+    # Keep OpenCV single-threaded so it doesn't compete with MediaPipe
+    cv2.setNumThreads(1)
+    cap = LatestFrameGrabber(initialize_camera())
+    
+    # Offload colour conversion and drawing to OpenCL when available
+    use_opencl = USE_OPENCL and cv2.ocl.haveOpenCL()
+    cv2.ocl.setUseOpenCL(use_opencl)
+    if use_opencl:
+        print("OpenCL enabled for the draw path")
     
     # Initialize components
-    detector = HandDetector(max_hands=1)
+    detector = HandDetector(max_hands=1, model_path=HAND_LANDMARKER_MODEL_PATH,
+                           infer_scale=INFERENCE_SCALE,
+                           model_complexity=HAND_MODEL_COMPLEXITY,
+                           delegate=HAND_DETECTION_DELEGATE)
+    if THREADED_DETECTION:
+        detector = ThreadedHandDetector(detector)
     mouse_controller = MouseController()
     gesture_handler = GestureHandler(detector, mouse_controller)
     fps_counter = FPSCounter()
+    frame_limiter = FrameLimiter(TARGET_FPS)
+    frame_idx = 0
+    no_hand_streak = 0
     
     print("Virtual Mouse started. Press 'q' to quit.")
     print("\nGestures:")
@@ -41,24 +61,43 @@ def main():
     try:
         # Main loop
         while True:
+            frame_limiter.wait()
+            
+            # Skip inference entirely when no new camera frame has arrived
+            if not cap.has_new_frame():
+                if cv2.waitKey(1) & 0xFF == ord('q'):
+                    break
+                continue
+            
             success, img = cap.read()
             if not success:
                 print("Failed to read from camera")
                 continue
+            if use_opencl:
+                img = cv2.UMat(img)
             
-            # Detect hands and landmarks
-            img = detector.find_hands(img)
-            lm_list, bbox = detector.find_position(img, draw=False)
-            
-            # Get finger states
-            fingers = detector.fingers_up() if len(lm_list) != 0 else [0, 0, 0, 0, 0]
-            
-            # Process gestures
-            img = gesture_handler.process_frame(img, lm_list, fingers)
+            # With no hand in view for a while, only run detection on every Nth
+            # frame; the palm detector has to re-acquire the hand anyway
+            frame_idx += 1
+            idle = (no_hand_streak > NO_HAND_IDLE_FRAMES and
+                    frame_idx % NO_HAND_DETECTION_INTERVAL != 0)
             
-            # Update and display FPS
-            fps = fps_counter.update()
-            img = fps_counter.draw_fps(img, fps)
+            if not idle:
+                # Detect hands and landmarks
+                img = detector.find_hands(img, draw=DEBUG_DRAW)
+                lm_arr, bbox = detector.find_position(img, draw=DEBUG_DRAW)
+                no_hand_streak = 0 if detector.has_hand else no_hand_streak + 1
+                
+                # Get finger states
+                _, fingers_bits = (detector.fingers_up() if detector.has_hand
+                                   else ([0, 0, 0, 0, 0], 0))
+                
+                # Process gestures
+                img = gesture_handler.process_frame(img, lm_arr, fingers_bits)
+                
+                # Update and display FPS
+                fps = fps_counter.update()
+                img = fps_counter.draw_fps(img, fps)
             
             # Display frame
             cv2.imshow(WINDOW_TITLE, img)
@@ -75,6 +114,7 @@ def main():
         # Cleanup
         print("Cleaning up...")
         gesture_handler.cleanup()
+        detector.close()
         cap.release()
         cv2.destroyAllWindows()
         print("Application closed.")
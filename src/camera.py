@@ -3,14 +3,60 @@ Camera initialization utilities.
 Handles camera detection and setup with multiple backend support.
 """
 
+import sys
+import threading
+import time
 import cv2
-from .config import CAMERA_WIDTH, CAMERA_HEIGHT, CAMERA_PRIORITIES
+from .config import (
+    CAMERA_WIDTH, CAMERA_HEIGHT, CAMERA_PRIORITIES, CAMERA_BUFFER_SIZE,
+    CAMERA_RETRY_DELAY
+)
+
+
+def _platform_backends():
+    """
+    Get the preferred capture backends for the current platform.
+    
+    Returns:
+        list: (backend_id, backend_name) tuples in order of preference
+    """
+    if sys.platform.startswith("win"):
+        # MSMF honours low-latency mode, DirectShow kept as a fallback
+        return [(cv2.CAP_MSMF, "MSMF"), (cv2.CAP_DSHOW, "DirectShow")]
+    if sys.platform.startswith("linux"):
+        return [(cv2.CAP_V4L2, "V4L2")]
+    return []
+
+
+def _try_open(camera_idx, backend=None):
+    """
+    Try to open a camera and read a test frame.
+    
+    Args:
+        camera_idx: Camera index to open
+        backend: OpenCV capture backend, or None for the default backend
+    
+    Returns:
+        cv2.VideoCapture: Opened camera object, or None on failure
+    """
+    if backend is None:
+        cap = cv2.VideoCapture(camera_idx)
+    else:
+        cap = cv2.VideoCapture(camera_idx, backend)
+    
+    if cap.isOpened():
+        ret, test_frame = cap.read()
+        if ret:
+            return cap
+    cap.release()
+    return None
 
 
 def initialize_camera():
     """
     Initialize camera with automatic detection.
-    Tries DirectShow backend first (Windows), then falls back to default backend.
+    Tries the platform-specific backends first (MSMF/DirectShow on Windows,
+    V4L2 on Linux), then falls back to the default backend.
     
     Returns:
         cv2.VideoCapture: Initialized camera object, or None if no camera found
@@ -20,38 +66,23 @@ def initialize_camera():
     """
     cap = None
     
-    # Try DirectShow backend first (Windows-specific)
-    for camera_idx in CAMERA_PRIORITIES:
-        cap = cv2.VideoCapture(camera_idx, cv2.CAP_DSHOW)
-        if cap.isOpened():
-            ret, test_frame = cap.read()
-            if ret:
-                print(f"Camera found at index {camera_idx}")
+    # Try platform-specific backends first
+    for backend, backend_name in _platform_backends():
+        for camera_idx in CAMERA_PRIORITIES:
+            cap = _try_open(camera_idx, backend)
+            if cap is not None:
+                print(f"Camera found at index {camera_idx} ({backend_name} backend)")
                 break
-            else:
-                cap.release()
-                cap = None
-        else:
-            if cap:
-                cap.release()
-            cap = None
-    
-    # If DirectShow didn't work, try default backend
-    if cap is None or not cap.isOpened():
+        if cap is not None:
+            break
+    
+    # If no platform backend worked, try default backend
+    if cap is None:
         for camera_idx in CAMERA_PRIORITIES[:3]:  # Try first 3 indices
-            cap = cv2.VideoCapture(camera_idx)
-            if cap.isOpened():
-                ret, test_frame = cap.read()
-                if ret:
-                    print(f"Camera found at index {camera_idx} (default backend)")
-                    break
-                else:
-                    cap.release()
-                    cap = None
-            else:
-                if cap:
-                    cap.release()
-                cap = None
+            cap = _try_open(camera_idx)
+            if cap is not None:
+                print(f"Camera found at index {camera_idx} (default backend)")
+                break
     
     if cap is None or not cap.isOpened():
         print("ERROR: Could not open any camera. Please check:")
@@ -60,9 +91,86 @@ def initialize_camera():
         print("3. Try restarting the application")
         raise SystemExit(1)
     
+    # Keep only the newest frame in the driver buffer to avoid stale-frame lag
+    if not cap.set(cv2.CAP_PROP_BUFFERSIZE, CAMERA_BUFFER_SIZE):
+        print("WARNING: Camera backend does not support setting the buffer size")
+    
     # Set camera properties
     cap.set(cv2.CAP_PROP_FRAME_WIDTH, CAMERA_WIDTH)
     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAMERA_HEIGHT)
     
     return cap
 
+
+class LatestFrameGrabber:
+    """
+    Background frame grabber that always holds the newest camera frame.
+    Decouples frame capture from hand detection so frames never queue up
+    behind MediaPipe inference.
+    """
+    
+    def __init__(self, cap):
+        """
+        Initialize the grabber and start the capture thread.
+        
+        Args:
+            cap: Opened cv2.VideoCapture object
+        """
+        self.cap = cap
+        self._lock = threading.Lock()
+        self._stop = False
+        
+        # Seed with a first frame so read() never starts empty
+        self._success, self._frame = self.cap.read()
+        self._frame_id = 0  # Incremented for every new frame grabbed
+        self._read_id = -1  # Frame id last returned by read()
+        
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def _run(self):
+        """Continuously read frames, keeping only the most recent one."""
+        while not self._stop:
+            success, frame = self.cap.read()
+            with self._lock:
+                self._success = success
+                if success:
+                    self._frame = frame
+                    self._frame_id += 1
+            if not success:
+                # Back off so a lost camera doesn't spin a core on failed reads
+                time.sleep(CAMERA_RETRY_DELAY)
+    
+    def read(self):
+        """
+        Get the most recent frame.
+        
+        Returns:
+            tuple: (success, frame) - same contract as cv2.VideoCapture.read()
+        """
+        with self._lock:
+            if not self._success or self._frame is None:
+                return False, None
+            self._read_id = self._frame_id
+            return True, self._frame.copy()
+    
+    def has_new_frame(self):
+        """
+        Check whether read() has something new to report.
+        
+        Returns:
+            True if a frame newer than the last one read is available, or if
+            the last capture failed so read() will report the failure
+        """
+        with self._lock:
+            return self._frame_id != self._read_id or not self._success
+    
+    def release(self):
+        """Stop the capture thread and release the camera."""
+        self._stop = True
+        self._thread.join(timeout=1.0)
+        if self._thread.is_alive():
+            # Releasing while the thread is still inside cap.read() is unsafe
+            print("WARNING: Capture thread did not stop, camera not released")
+            return
+        self.cap.release()
@@ -7,10 +7,22 @@ All settings and parameters are centralized here.
 CAMERA_WIDTH = 640
 CAMERA_HEIGHT = 480
 CAMERA_PRIORITIES = [2, 0, 1, 3, 4]  # Prioritize camera index 2
+CAMERA_BUFFER_SIZE = 1  # Frames buffered by the driver (1 = always newest frame)
+CAMERA_RETRY_DELAY = 0.1  # Wait after a failed frame read before retrying (seconds)
+
+# Hand detection settings
+HAND_LANDMARKER_MODEL_PATH = "hand_landmarker.task"  # Tasks model, legacy Hands used if missing
+HAND_MODEL_COMPLEXITY = 0  # Legacy Hands model: 0 = LITE, 1 = FULL
+HAND_DETECTION_DELEGATE = "GPU"  # Tasks delegate: "CPU" or "GPU" (falls back to CPU)
+THREADED_DETECTION = True  # Run hand detection on a worker thread
+NO_HAND_IDLE_FRAMES = 10  # Frames without a hand before detection is throttled
+NO_HAND_DETECTION_INTERVAL = 2  # While idle, run detection on every Nth frame only
+INFERENCE_SCALE = 0.5  # Frame scale fed to MediaPipe (landmarks map back to full frame)
 
 # Frame settings
 FRAME_REDUCTION = 100  # Frame Reduction area
 SMOOTHENING = 7  # Mouse movement smoothing factor
+TARGET_FPS = 60  # Main loop rate cap
 
 # Scroll configuration
 BASE_SCROLL_SENSITIVITY = 5.0  # Base scroll speed
@@ -23,6 +35,8 @@ DRAG_CLICK_THRESHOLD = 0.3  # Time to hold pinch before drag activates (seconds)
 
 # Gesture thresholds
 PINCH_DISTANCE_THRESHOLD = 40  # Distance threshold for pinch gestures (pixels)
+PINCH_DISTANCE_THRESHOLD_SQ = PINCH_DISTANCE_THRESHOLD ** 2  # Squared, avoids sqrt per frame
+CLICK_COOLDOWN = 0.3  # Minimum time between repeated clicks (seconds)
 
 # Display settings
 WINDOW_TITLE = "Osamah H. Alaini"
@@ -30,6 +44,8 @@ FPS_DISPLAY_POSITION = (20, 50)
 FPS_FONT_SCALE = 3
 FPS_COLOR = (255, 0, 0)
 FPS_THICKNESS = 3
+DEBUG_DRAW = False  # Draw MediaPipe landmarks and bounding box (development only)
+USE_OPENCL = False  # Draw on cv2.UMat frames via OpenCL when available (helps on some iGPUs)
 
 # Visual feedback colors (BGR format)
 COLOR_MOVE_POINTER = (255, 0, 255)  # Magenta
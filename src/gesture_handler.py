@@ -4,15 +4,24 @@ Main logic for gesture recognition and mouse control.
 """
 
 import cv2
-import numpy as np
 import time
 from .config import (
     CAMERA_WIDTH, CAMERA_HEIGHT, FRAME_REDUCTION, SMOOTHENING,
-    DRAG_CLICK_THRESHOLD, PINCH_DISTANCE_THRESHOLD,
+    DRAG_CLICK_THRESHOLD, PINCH_DISTANCE_THRESHOLD_SQ, CLICK_COOLDOWN,
     COLOR_MOVE_POINTER, COLOR_LEFT_CLICK, COLOR_RIGHT_CLICK,
-    COLOR_FRAME_BOUNDARY, SCROLL_BOOST_MULTIPLIER
+    COLOR_FRAME_BOUNDARY, COLOR_SCROLL_NEUTRAL_ZONE, COLOR_SCROLL_ACCELERATION_ZONE,
+    SCROLL_BOOST_MULTIPLIER
 )
 from .scroll_handler import ScrollHandler
+from .hand_detector import (
+    FINGER_THUMB, FINGER_INDEX, FINGER_MIDDLE, FINGER_RING, FINGER_PINKY
+)
+
+# Finger state patterns for gestures
+SCROLL_FINGERS = FINGER_RING | FINGER_PINKY
+LEFT_CLICK_FINGERS = FINGER_INDEX | FINGER_MIDDLE
+RIGHT_CLICK_MASK = FINGER_THUMB | FINGER_INDEX | FINGER_MIDDLE
+RIGHT_CLICK_FINGERS = FINGER_THUMB | FINGER_INDEX
 
 
 class GestureHandler:
@@ -44,28 +53,35 @@ class GestureHandler:
         self.drag_active = False
         self.drag_start_time = 0
         
+        # Click cooldown state (non-blocking debounce)
+        self._last_click_t = 0.0
+        self._last_rclick_t = 0.0
+        
         # Screen dimensions
         self.w_screen, self.h_screen = mouse_controller.get_screen_size()
+        
+        # Linear camera-to-screen mapping (x_screen = x * scale + offset)
+        self._sx = self.w_screen / (CAMERA_WIDTH - 2 * FRAME_REDUCTION)
+        self._sy = self.h_screen / (CAMERA_HEIGHT - 2 * FRAME_REDUCTION)
+        self._bx = -FRAME_REDUCTION * self._sx
+        self._by = -FRAME_REDUCTION * self._sy
     
-    def process_frame(self, img, lm_list, fingers):
+    def process_frame(self, img, lm_arr, fingers_bits):
         """
         Process a single frame and execute gestures.
         
         Args:
             img: Current frame image
-            lm_list: List of hand landmarks
-            fingers: List of finger states [thumb, index, middle, ring, pinky]
+            lm_arr: (21, 2) array of hand landmark [x, y] positions
+            fingers_bits: Packed finger states (FINGER_* bit flags)
         
         Returns:
             Processed image with visual feedback
         """
         # Extract landmark positions if hand detected
-        if len(lm_list) != 0:
-            x1, y1 = lm_list[8][1:]   # Index finger
-            x2, y2 = lm_list[12][1:]  # Middle finger
-            x3, y3 = lm_list[4][1:]   # Thumb tip
-            x5, y5 = lm_list[20][1:]  # Pinky tip
-            wrist_y = lm_list[0][2] if len(lm_list) > 0 else y5  # Use wrist for more stable reference
+        if self.detector.has_hand:
+            x1, y1 = lm_arr[8].tolist()  # Index finger
+            wrist_y = int(lm_arr[0, 1])  # Use wrist for more stable reference
         else:
             # No hand detected, reset drag state
             if self.drag_active:
@@ -80,7 +96,7 @@ class GestureHandler:
                      COLOR_FRAME_BOUNDARY, 2)
         
         # Handle scroll mode (priority)
-        if fingers[4] == 1 and fingers[3] == 1 and sum(fingers[:3]) == 0:  # Only ring + pinky up
+        if fingers_bits == SCROLL_FINGERS:  # Only ring + pinky up
             img = self._handle_scroll(img, wrist_y)
             # Deactivate drag if active during scroll
             if self.drag_active:
@@ -91,8 +107,8 @@ class GestureHandler:
             self.scroll_handler.deactivate_scroll_mode()
             
             # Handle movement and drag
-            if fingers[1] == 1:  # Index finger up
-                img = self._handle_movement(img, x1, y1, fingers)
+            if fingers_bits & FINGER_INDEX:  # Index finger up
+                img = self._handle_movement(img, x1, y1, fingers_bits)
             else:
                 # Reset drag when index finger goes down
                 if self.drag_active:
@@ -102,23 +118,23 @@ class GestureHandler:
             
             # Handle clicks (only if not dragging)
             if not self.drag_active:
-                img = self._handle_left_click(img, fingers, lm_list)
-                img = self._handle_right_click(img, fingers, lm_list)
+                img = self._handle_left_click(img, fingers_bits, lm_arr)
+                img = self._handle_right_click(img, fingers_bits, lm_arr)
         
         return img
     
-    def _handle_movement(self, img, x1, y1, fingers):
+    def _handle_movement(self, img, x1, y1, fingers_bits):
         """
         Handle mouse movement and drag.
         
         Args:
             img: Current frame
             x1, y1: Index finger coordinates
-            fingers: Finger states
+            fingers_bits: Packed finger states
         """
         # Map hand coordinates to screen coordinates
-        x_mapped = np.interp(x1, (FRAME_REDUCTION, CAMERA_WIDTH - FRAME_REDUCTION), (0, self.w_screen))
-        y_mapped = np.interp(y1, (FRAME_REDUCTION, CAMERA_HEIGHT - FRAME_REDUCTION), (0, self.h_screen))
+        x_mapped = min(max(x1 * self._sx + self._bx, 0), self.w_screen)
+        y_mapped = min(max(y1 * self._sy + self._by, 0), self.h_screen)
         
         # Apply smoothing
         self.cloc_x = self.ploc_x + (x_mapped - self.ploc_x) / SMOOTHENING
@@ -130,9 +146,9 @@ class GestureHandler:
         self.ploc_x, self.ploc_y = self.cloc_x, self.cloc_y
         
         # Handle drag: Thumb + Index pinch & hold
-        if fingers[0] == 1:  # Thumb up
-            length, img, _ = self.detector.find_distance(4, 8, img)
-            if length < PINCH_DISTANCE_THRESHOLD:
+        if fingers_bits & FINGER_THUMB:  # Thumb up
+            length_sq, img, _ = self.detector.find_distance_sq(4, 8, img)
+            if length_sq < PINCH_DISTANCE_THRESHOLD_SQ:
                 if not self.drag_mode:
                     self.drag_start_time = time.time()
                     self.drag_mode = True
@@ -157,38 +173,42 @@ class GestureHandler:
         
         return img
     
-    def _handle_left_click(self, img, fingers, lm_list):
+    def _handle_left_click(self, img, fingers_bits, lm_arr):
         """
         Handle left click gesture (index + middle finger).
         
         Args:
             img: Current frame
-            fingers: Finger states
-            lm_list: Landmark list
+            fingers_bits: Packed finger states
+            lm_arr: Landmark array
         """
-        if fingers[1] == 1 and fingers[2] == 1:  # Index and middle up
-            length, img, line_info = self.detector.find_distance(8, 12, img)
-            if length < PINCH_DISTANCE_THRESHOLD:
+        if (fingers_bits & LEFT_CLICK_FINGERS) == LEFT_CLICK_FINGERS:  # Index and middle up
+            length_sq, img, line_info = self.detector.find_distance_sq(8, 12, img)
+            if length_sq < PINCH_DISTANCE_THRESHOLD_SQ:
                 cv2.circle(img, (line_info[4], line_info[5]), 15, COLOR_LEFT_CLICK, cv2.FILLED)
-                self.mouse_controller.click()
-                time.sleep(0.3)
+                now = time.monotonic()
+                if now - self._last_click_t > CLICK_COOLDOWN:
+                    self.mouse_controller.click()
+                    self._last_click_t = now
         return img
     
-    def _handle_right_click(self, img, fingers, lm_list):
+    def _handle_right_click(self, img, fingers_bits, lm_arr):
         """
         Handle right click gesture (thumb + index, middle down).
         
         Args:
             img: Current frame
-            fingers: Finger states
-            lm_list: Landmark list
+            fingers_bits: Packed finger states
+            lm_arr: Landmark array
         """
-        if fingers[0] == 1 and fingers[1] == 1 and fingers[2] == 0:  # Thumb + index, middle down
-            length, img, line_info = self.detector.find_distance(4, 8, img)
-            if length < PINCH_DISTANCE_THRESHOLD:
+        if (fingers_bits & RIGHT_CLICK_MASK) == RIGHT_CLICK_FINGERS:  # Thumb + index, middle down
+            length_sq, img, line_info = self.detector.find_distance_sq(4, 8, img)
+            if length_sq < PINCH_DISTANCE_THRESHOLD_SQ:
                 cv2.circle(img, (line_info[4], line_info[5]), 15, COLOR_RIGHT_CLICK, cv2.FILLED)
-                self.mouse_controller.right_click()
-                time.sleep(0.3)
+                now = time.monotonic()
+                if now - self._last_rclick_t > CLICK_COOLDOWN:
+                    self.mouse_controller.right_click()
+                    self._last_rclick_t = now
         return img
     
     def _handle_scroll(self, img, wrist_y):
@@ -213,10 +233,12 @@ class GestureHandler:
         
         # Draw neutral zone
         cv2.rectangle(img, (0, neutral_top), (CAMERA_WIDTH, neutral_bottom), 
-                     (0, 255, 0), 1)
+                     COLOR_SCROLL_NEUTRAL_ZONE, 1)
         # Draw acceleration zones
-        cv2.rectangle(img, (0, 0), (CAMERA_WIDTH, neutral_top), (0, 0, 255), 1)  # Top zone
-        cv2.rectangle(img, (0, neutral_bottom), (CAMERA_WIDTH, CAMERA_HEIGHT), (0, 0, 255), 1)  # Bottom zone
+        cv2.rectangle(img, (0, 0), (CAMERA_WIDTH, neutral_top),
+                     COLOR_SCROLL_ACCELERATION_ZONE, 1)  # Top zone
+        cv2.rectangle(img, (0, neutral_bottom), (CAMERA_WIDTH, CAMERA_HEIGHT),
+                     COLOR_SCROLL_ACCELERATION_ZONE, 1)  # Bottom zone
         
         # Perform scroll if conditions are met
         if self.scroll_handler.should_scroll(scroll_speed):
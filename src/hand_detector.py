@@ -3,9 +3,25 @@ Hand Detection Module using MediaPipe.
 Provides HandDetector class for detecting and tracking hand landmarks.
 """
 
+import os
+import queue
+import threading
+import time
 import cv2
 import mediapipe as mp
 import math
+import numpy as np
+from mediapipe.framework.formats import landmark_pb2
+
+
+# Bit flags for packed finger states returned by HandDetector.fingers_up
+FINGER_THUMB = 1 << 0
+FINGER_INDEX = 1 << 1
+FINGER_MIDDLE = 1 << 2
+FINGER_RING = 1 << 3
+FINGER_PINKY = 1 << 4
+_FINGER_BIT_WEIGHTS = np.array([FINGER_THUMB, FINGER_INDEX, FINGER_MIDDLE,
+                                FINGER_RING, FINGER_PINKY], np.int32)
 
 
 class HandDetector:
@@ -14,7 +30,8 @@ class HandDetector:
     Detects hand landmarks and provides utilities for gesture recognition.
     """
     
-    def __init__(self, mode=False, max_hands=2, detection_con=0.5, track_con=0.5):
+    def __init__(self, mode=False, max_hands=2, detection_con=0.5, track_con=0.5,
+                 model_path=None, infer_scale=1.0, model_complexity=1, delegate="CPU"):
         """
         Initialize the HandDetector.
         
@@ -23,116 +40,257 @@ class HandDetector:
             max_hands: Maximum number of hands to detect
             detection_con: Minimum detection confidence threshold
             track_con: Minimum tracking confidence threshold
+            model_path: Path to a MediaPipe Tasks hand_landmarker.task model.
+                If the file exists, the Tasks HandLandmarker is used in VIDEO
+                mode; otherwise falls back to the legacy Hands solution.
+            infer_scale: Factor to resize frames by before inference. Landmarks
+                are normalized, so positions still map to the full frame.
+            model_complexity: Legacy Hands model (0 = LITE, 1 = FULL)
+            delegate: Tasks inference delegate, "CPU" or "GPU". Falls back to
+                CPU if the GPU delegate is unavailable.
         """
         self.mode = mode
         self.max_hands = max_hands
         self.detection_con = detection_con
         self.track_con = track_con
+        self.infer_scale = infer_scale
+        self.model_complexity = model_complexity
+        self.delegate = delegate
 
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=self.mode,
-            max_num_hands=self.max_hands,
-            min_detection_confidence=self.detection_con,
-            min_tracking_confidence=self.track_con
-        )
+        self.landmarker = None
+        self.hands = None
+        if model_path and os.path.isfile(model_path):
+            self.landmarker = self._create_landmarker(model_path)
+        else:
+            self.hands = self.mp_hands.Hands(
+                static_image_mode=self.mode,
+                max_num_hands=self.max_hands,
+                model_complexity=self.model_complexity,
+                min_detection_confidence=self.detection_con,
+                min_tracking_confidence=self.track_con
+            )
         self.mp_draw = mp.solutions.drawing_utils
         self.tip_ids = [4, 8, 12, 16, 20]  # Landmark IDs for finger tips
+        self._pip_ids = [6, 10, 14, 18]  # PIP joints for index..pinky
+        self.hand_landmarks = []
+        self.frame_size = (0, 0)  # (height, width) of the last processed frame
+        self.lm_arr = np.empty((0, 2), np.int16)  # (21, 2) landmark pixel positions
+        self.has_hand = False
+        self._last_timestamp_ms = 0
+        self._buffers = [None, None]  # Preallocated [downscaled, RGB] frames fed to MediaPipe
+
+    def _create_landmarker(self, model_path):
+        """
+        Create a Tasks HandLandmarker.
+        In VIDEO mode the landmarker tracks the hand ROI from the previous
+        frame and only re-runs palm detection when tracking is lost.
+        
+        Args:
+            model_path: Path to the hand_landmarker.task model
+        
+        Returns:
+            HandLandmarker instance
+        """
+        vision = mp.tasks.vision
+        running_mode = (vision.RunningMode.IMAGE if self.mode
+                        else vision.RunningMode.VIDEO)
+        delegates = [self.delegate.upper()]
+        if delegates[0] != "CPU":
+            delegates.append("CPU")
+
+        for delegate in delegates:
+            options = vision.HandLandmarkerOptions(
+                base_options=mp.tasks.BaseOptions(
+                    model_asset_path=model_path,
+                    delegate=getattr(mp.tasks.BaseOptions.Delegate, delegate)),
+                running_mode=running_mode,
+                num_hands=self.max_hands,
+                min_hand_detection_confidence=self.detection_con,
+                min_hand_presence_confidence=self.detection_con,
+                min_tracking_confidence=self.track_con
+            )
+            try:
+                return vision.HandLandmarker.create_from_options(options)
+            except (RuntimeError, NotImplementedError) as e:
+                if delegate == "CPU":
+                    raise
+                print(f"WARNING: {delegate} delegate unavailable ({e}), using CPU")
+
+    def _next_timestamp_ms(self):
+        """
+        Get a strictly increasing timestamp for VIDEO mode detection.
+        
+        Returns:
+            Timestamp in milliseconds
+        """
+        timestamp_ms = int(time.monotonic() * 1000)
+        if timestamp_ms <= self._last_timestamp_ms:
+            timestamp_ms = self._last_timestamp_ms + 1
+        self._last_timestamp_ms = timestamp_ms
+        return timestamp_ms
+
+    def _prepare_input(self, img, buffers=None):
+        """
+        Downscale and convert a frame to the RGB input MediaPipe expects.
+        
+        Args:
+            img: Input image (BGR format), numpy array or cv2.UMat
+            buffers: [downscaled, RGB] list of arrays to write into, reallocated
+                in place when the frame shape changes. Defaults to the
+                detector's own buffers.
+        
+        Returns:
+            tuple: (frame, img_rgb) - CPU copy of the frame and inference input
+        """
+        if buffers is None:
+            buffers = self._buffers
+
+        # MediaPipe needs a CPU array, so download UMat frames for inference only
+        frame = img.get() if isinstance(img, cv2.UMat) else img
+        h, w = frame.shape[:2]
+        self.frame_size = (h, w)
+
+        if self.infer_scale != 1.0:
+            small_shape = (round(h * self.infer_scale), round(w * self.infer_scale), 3)
+            if buffers[0] is None or buffers[0].shape != small_shape:
+                buffers[0] = np.empty(small_shape, np.uint8)
+            small = cv2.resize(frame, (small_shape[1], small_shape[0]),
+                               dst=buffers[0], interpolation=cv2.INTER_AREA)
+        else:
+            small = frame
+
+        # Reuse the RGB buffer between frames instead of allocating a new one
+        if buffers[1] is None or buffers[1].shape != small.shape:
+            buffers[1] = np.empty_like(small)
+        return frame, cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=buffers[1])
+
+    def _detect(self, img_rgb):
+        """
+        Run hand landmark inference on a prepared RGB frame.
+        
+        Args:
+            img_rgb: RGB image from _prepare_input
+        
+        Returns:
+            tuple: (results, hand_landmarks) - raw MediaPipe results and
+                a list of landmark sequences, one per detected hand
+        """
+        if self.landmarker is not None:
+            mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=img_rgb)
+            if self.mode:
+                results = self.landmarker.detect(mp_image)
+            else:
+                results = self.landmarker.detect_for_video(
+                    mp_image, self._next_timestamp_ms())
+            return results, results.hand_landmarks
+
+        results = self.hands.process(img_rgb)
+        return results, [hand.landmark for hand in results.multi_hand_landmarks or []]
+
+    def _draw_hands(self, img, frame):
+        """
+        Draw the current hand landmarks and connections.
+        
+        Args:
+            img: Image passed to find_hands
+            frame: CPU copy of img from _prepare_input
+        
+        Returns:
+            Image with drawn landmarks
+        """
+        for hand_landmarks in self.hand_landmarks:
+            landmark_list = landmark_pb2.NormalizedLandmarkList()
+            landmark_list.landmark.extend(
+                landmark_pb2.NormalizedLandmark(x=lm.x, y=lm.y, z=lm.z)
+                for lm in hand_landmarks)
+            self.mp_draw.draw_landmarks(
+                frame, landmark_list, self.mp_hands.HAND_CONNECTIONS)
+        return cv2.UMat(frame) if isinstance(img, cv2.UMat) else frame
 
     def find_hands(self, img, draw=True):
         """
         Detect hands in the image and optionally draw landmarks.
         
         Args:
-            img: Input image (BGR format)
+            img: Input image (BGR format), numpy array or cv2.UMat
             draw: If True, draw hand landmarks and connections
         
         Returns:
             Image with or without drawn landmarks
         """
-        img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-        self.results = self.hands.process(img_rgb)
+        frame, img_rgb = self._prepare_input(img)
+        self.results, self.hand_landmarks = self._detect(img_rgb)
 
-        if self.results.multi_hand_landmarks:
-            for hand_landmarks in self.results.multi_hand_landmarks:
-                if draw:
-                    self.mp_draw.draw_landmarks(
-                        img, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
+        if draw:
+            img = self._draw_hands(img, frame)
         return img
 
-    def find_position(self, img, hand_no=0, draw=True):
+    def find_position(self, img, hand_no=0, draw=False):
         """
         Get hand landmark positions in pixel coordinates.
         
         Args:
-            img: Input image
+            img: Input image (numpy array or cv2.UMat)
             hand_no: Which hand to track (0 for first detected hand)
-            draw: If True, draw landmarks and bounding box
+            draw: If True, draw landmarks and bounding box (debug only)
         
         Returns:
-            tuple: (landmark_list, bbox)
-                - landmark_list: List of [id, x, y] for each landmark
+            tuple: (landmark_array, bbox)
+                - landmark_array: (21, 2) int16 array of [x, y] per landmark,
+                  empty if no hand is detected
                 - bbox: Bounding box as (x_min, y_min, x_max, y_max)
         """
-        x_list = []
-        y_list = []
         bbox = []
-        self.lm_list = []
-        
-        if self.results.multi_hand_landmarks:
-            my_hand = self.results.multi_hand_landmarks[hand_no]
-            for id, lm in enumerate(my_hand.landmark):
-                h, w, c = img.shape
-                cx, cy = int(lm.x * w), int(lm.y * h)
-                x_list.append(cx)
-                y_list.append(cy)
-                self.lm_list.append([id, cx, cy])
-                if draw:
-                    cv2.circle(img, (cx, cy), 5, (255, 0, 255), cv2.FILLED)
+        self.lm_arr = np.empty((0, 2), np.int16)
+        self.has_hand = False
+        
+        if len(self.hand_landmarks) > hand_no:
+            my_hand = self.hand_landmarks[hand_no]
+            h, w = self.frame_size
+            # One pass over the landmark field, then scale all points at once
+            pts = np.array([(lm.x, lm.y) for lm in my_hand], dtype=np.float32)
+            pts *= (w, h)
+            self.lm_arr = pts.astype(np.int16)
+            self.has_hand = True
 
-            x_min, x_max = min(x_list), max(x_list)
-            y_min, y_max = min(y_list), max(y_list)
-            bbox = x_min, y_min, x_max, y_max
+            bbox = tuple(self.lm_arr.min(0).tolist() + self.lm_arr.max(0).tolist())
 
             if draw:
+                x_min, y_min, x_max, y_max = bbox
+                for cx, cy in self.lm_arr.tolist():
+                    cv2.circle(img, (cx, cy), 5, (255, 0, 255), cv2.FILLED)
                 cv2.rectangle(img, (x_min - 20, y_min - 20), (x_max + 20, y_max + 20),
                               (0, 255, 0), 2)
 
-        return self.lm_list, bbox
+        return self.lm_arr, bbox
 
     def fingers_up(self):
         """
         Determine which fingers are up.
         
         Returns:
-            List of 5 integers [thumb, index, middle, ring, pinky]
-            where 1 means finger is up, 0 means down
+            tuple: (fingers, fingers_bits)
+                - fingers: List of 5 integers [thumb, index, middle, ring, pinky]
+                  where 1 means finger is up, 0 means down
+                - fingers_bits: Same states packed into an int, one FINGER_* bit per finger
         """
-        fingers = []
+        pts = self.lm_arr
         # Safety check - return all fingers down if no landmarks
-        if not hasattr(self, 'lm_list') or len(self.lm_list) < 21:  # 21 landmarks in mediapipe hand model
-            return [0, 0, 0, 0, 0]
+        if pts.shape[0] < 21:  # 21 landmarks in mediapipe hand model
+            return [0, 0, 0, 0, 0], 0
         
-        # Thumb (more robust check)
-        try:
-            thumb_up = self.lm_list[self.tip_ids[0]][1] > self.lm_list[self.tip_ids[0] - 1][1]
-            fingers.append(1 if thumb_up else 0)
-        except (IndexError, TypeError):
-            fingers.append(0)
-
-        # Other fingers
-        for id in range(1, 5):
-            try:
-                finger_up = self.lm_list[self.tip_ids[id]][2] < self.lm_list[self.tip_ids[id] - 2][2]
-                fingers.append(1 if finger_up else 0)
-            except (IndexError, TypeError):
-                fingers.append(0)
-        
-        return fingers
+        tips = pts[self.tip_ids]
+        fingers = np.empty(5, np.int8)
+        # Thumb compares x against the joint below it, other fingers compare y against their PIP joint
+        fingers[0] = tips[0, 0] > pts[self.tip_ids[0] - 1, 0]
+        fingers[1:] = tips[1:, 1] < pts[self._pip_ids, 1]
+        return fingers.tolist(), int(fingers @ _FINGER_BIT_WEIGHTS)
 
-    def find_distance(self, p1, p2, img, draw=True, r=15, t=3):
+    def find_distance_sq(self, p1, p2, img, draw=True, r=15, t=3):
         """
-        Calculate distance between two landmark points.
+        Calculate squared distance between two landmark points.
+        Cheaper than find_distance when only comparing against a threshold.
         
         Args:
             p1: First landmark ID
@@ -143,13 +301,13 @@ class HandDetector:
             t: Line thickness
         
         Returns:
-            tuple: (length, img, [x1, y1, x2, y2, cx, cy])
+            tuple: (length_sq, img, [x1, y1, x2, y2, cx, cy])
         """
-        if not hasattr(self, 'lm_list') or len(self.lm_list) < max(p1, p2) + 1:
+        if len(self.lm_arr) < max(p1, p2) + 1:
             return 0, img, [0, 0, 0, 0, 0, 0]
             
-        x1, y1 = self.lm_list[p1][1:]
-        x2, y2 = self.lm_list[p2][1:]
+        # Convert to Python ints so the squared distance can't overflow int16
+        (x1, y1), (x2, y2) = self.lm_arr[[p1, p2]].tolist()
         cx, cy = (x1 + x2) // 2, (y1 + y2) // 2
 
         if draw:
@@ -158,6 +316,133 @@ class HandDetector:
             cv2.circle(img, (x2, y2), r, (255, 0, 255), cv2.FILLED)
             cv2.circle(img, (cx, cy), r, (0, 0, 255), cv2.FILLED)
             
-        length = math.hypot(x2 - x1, y2 - y1)
-        return length, img, [x1, y1, x2, y2, cx, cy]
+        dx, dy = x2 - x1, y2 - y1
+        return dx * dx + dy * dy, img, [x1, y1, x2, y2, cx, cy]
+
+    def find_distance(self, p1, p2, img, draw=True, r=15, t=3):
+        """
+        Calculate distance between two landmark points.
+        
+        Args:
+            p1: First landmark ID
+            p2: Second landmark ID
+            img: Image to draw on
+            draw: If True, draw line and circles
+            r: Circle radius
+            t: Line thickness
+        
+        Returns:
+            tuple: (length, img, [x1, y1, x2, y2, cx, cy])
+        """
+        length_sq, img, line_info = self.find_distance_sq(p1, p2, img, draw, r, t)
+        return math.sqrt(length_sq), img, line_info
 
+    def close(self):
+        """Release MediaPipe resources."""
+        if self.landmarker is not None:
+            self.landmarker.close()
+        else:
+            self.hands.close()
+
+
+class ThreadedHandDetector:
+    """
+    Runs HandDetector inference on a worker thread.
+    The main loop posts the newest frame and uses the most recent result, so
+    drawing and mouse control overlap with inference on the next frame.
+    Other attributes and methods are delegated to the wrapped detector.
+    """
+    
+    def __init__(self, detector):
+        """
+        Initialize the threaded detector and start the worker thread.
+        
+        Args:
+            detector: HandDetector instance to run inference with
+        """
+        self.detector = detector
+        self._frames = queue.Queue(maxsize=1)
+        
+        # Input buffer slots: at most one is queued and one is held by the
+        # worker, so three always leave a free slot for the next frame
+        self._slots = [[None, None] for _ in range(3)]
+        self._free_slots = queue.SimpleQueue()
+        for slot in range(len(self._slots)):
+            self._free_slots.put(slot)
+        
+        self._lock = threading.Lock()
+        self._latest = (None, [])
+        self._error = None  # Exception that stopped the worker, re-raised in find_hands
+        
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def __getattr__(self, name):
+        """Delegate attributes not defined here to the wrapped detector."""
+        return getattr(self.detector, name)
+    
+    def _run(self):
+        """Run inference on posted frames until a None sentinel arrives."""
+        while True:
+            item = self._frames.get()
+            if item is None:
+                break
+            slot, img_rgb = item
+            try:
+                latest = self.detector._detect(img_rgb)
+            except Exception as e:
+                # Drop the last result so a stale pinch can't keep firing gestures
+                with self._lock:
+                    self._latest = (None, [])
+                    self._error = e
+                break
+            finally:
+                self._free_slots.put(slot)
+            with self._lock:
+                self._latest = latest
+    
+    def _post(self, item):
+        """Queue an item for the worker, replacing any unprocessed frame."""
+        try:
+            dropped = self._frames.get_nowait()
+            if dropped is not None:
+                self._free_slots.put(dropped[0])
+        except queue.Empty:
+            pass
+        self._frames.put_nowait(item)
+    
+    def find_hands(self, img, draw=True):
+        """
+        Post a frame for detection and apply the most recent result.
+        
+        Args:
+            img: Input image (BGR format), numpy array or cv2.UMat
+            draw: If True, draw hand landmarks and connections
+        
+        Returns:
+            Image with or without drawn landmarks
+        
+        Raises:
+            Exception: The error that stopped the worker thread, if any
+        """
+        if self._error is not None:
+            raise self._error
+        if not self._thread.is_alive():
+            raise RuntimeError("Hand detection worker thread has stopped")
+        
+        slot = self._free_slots.get_nowait()
+        frame, img_rgb = self.detector._prepare_input(img, self._slots[slot])
+        self._post((slot, img_rgb))
+        
+        with self._lock:
+            self.detector.results, self.detector.hand_landmarks = self._latest
+        
+        if draw:
+            img = self.detector._draw_hands(img, frame)
+        return img
+    
+    def close(self):
+        """Stop the worker thread and release the detector."""
+        self._post(None)
+        self._thread.join(timeout=1.0)
+        self.detector.close()
@@ -1,11 +1,68 @@
 """
 Mouse control utilities.
-Wraps autopy and pyautogui for mouse operations.
+Uses the Win32 SendInput API directly on Windows, and wraps autopy and
+pyautogui for mouse operations on other platforms.
 """
 
+import sys
 import autopy
 import pyautogui
 
+USE_SEND_INPUT = sys.platform == "win32"
+
+if USE_SEND_INPUT:
+    import ctypes
+    from ctypes import wintypes
+
+    INPUT_MOUSE = 0
+    MOUSEEVENTF_MOVE = 0x0001
+    MOUSEEVENTF_LEFTDOWN = 0x0002
+    MOUSEEVENTF_LEFTUP = 0x0004
+    MOUSEEVENTF_RIGHTDOWN = 0x0008
+    MOUSEEVENTF_RIGHTUP = 0x0010
+    MOUSEEVENTF_WHEEL = 0x0800
+    MOUSEEVENTF_ABSOLUTE = 0x8000
+
+    class MOUSEINPUT(ctypes.Structure):
+        _fields_ = [
+            ("dx", wintypes.LONG),
+            ("dy", wintypes.LONG),
+            ("mouseData", wintypes.DWORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    class _INPUTUNION(ctypes.Union):
+        # MOUSEINPUT is the largest member, so the union has the Win32 size
+        _fields_ = [("mi", MOUSEINPUT)]
+
+    class INPUT(ctypes.Structure):
+        _anonymous_ = ("u",)
+        _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+    _send_input = ctypes.WinDLL("user32", use_last_error=True).SendInput
+    _send_input.argtypes = (wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int)
+    _send_input.restype = wintypes.UINT
+    _INPUT_SIZE = ctypes.sizeof(INPUT)
+
+
+def _send_mouse_events(*events):
+    """
+    Send a batch of mouse events in a single SendInput call.
+    
+    Args:
+        events: (flags, dx, dy, mouse_data) tuples
+    """
+    inputs = (INPUT * len(events))()
+    for inp, (flags, dx, dy, mouse_data) in zip(inputs, events):
+        inp.type = INPUT_MOUSE
+        inp.mi.dx = dx
+        inp.mi.dy = dy
+        inp.mi.mouseData = mouse_data & 0xFFFFFFFF
+        inp.mi.dwFlags = flags
+    _send_input(len(events), inputs, _INPUT_SIZE)
+
 
 class MouseController:
     """
@@ -16,6 +73,10 @@ class MouseController:
     def __init__(self):
         """Initialize mouse controller and get screen dimensions."""
         self.w_screen, self.h_screen = autopy.screen.size()
+        
+        # Absolute SendInput coordinates are normalized to 0..65535
+        self._norm_x = 65535 / max(self.w_screen - 1, 1)
+        self._norm_y = 65535 / max(self.h_screen - 1, 1)
     
     def move(self, x, y):
         """
@@ -26,15 +87,29 @@ class MouseController:
             x: Screen X coordinate
             y: Screen Y coordinate
         """
-        autopy.mouse.move(self.w_screen - x, y)
+        if USE_SEND_INPUT:
+            # Screen edges can map just past 65535, so clamp to the valid range
+            nx = min(max(int((self.w_screen - x) * self._norm_x), 0), 65535)
+            ny = min(max(int(y * self._norm_y), 0), 65535)
+            _send_mouse_events((MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE, nx, ny, 0))
+        else:
+            autopy.mouse.move(self.w_screen - x, y)
     
     def click(self):
         """Perform a left mouse click."""
-        autopy.mouse.click()
+        if USE_SEND_INPUT:
+            _send_mouse_events((MOUSEEVENTF_LEFTDOWN, 0, 0, 0),
+                               (MOUSEEVENTF_LEFTUP, 0, 0, 0))
+        else:
+            autopy.mouse.click()
     
     def right_click(self):
         """Perform a right mouse click."""
-        autopy.mouse.click(autopy.mouse.Button.RIGHT)
+        if USE_SEND_INPUT:
+            _send_mouse_events((MOUSEEVENTF_RIGHTDOWN, 0, 0, 0),
+                               (MOUSEEVENTF_RIGHTUP, 0, 0, 0))
+        else:
+            autopy.mouse.click(autopy.mouse.Button.RIGHT)
     
     def toggle_drag(self, state):
         """
@@ -43,7 +118,11 @@ class MouseController:
         Args:
             state: True to start dragging, False to stop
         """
-        autopy.mouse.toggle(autopy.mouse.Button.LEFT, state)
+        if USE_SEND_INPUT:
+            flags = MOUSEEVENTF_LEFTDOWN if state else MOUSEEVENTF_LEFTUP
+            _send_mouse_events((flags, 0, 0, 0))
+        else:
+            autopy.mouse.toggle(autopy.mouse.Button.LEFT, state)
     
     def scroll(self, amount):
         """
@@ -52,7 +131,11 @@ class MouseController:
         Args:
             amount: Scroll amount (positive for down, negative for up)
         """
-        pyautogui.scroll(amount)
+        if USE_SEND_INPUT:
+            # Same raw wheel units pyautogui sends on Windows
+            _send_mouse_events((MOUSEEVENTF_WHEEL, 0, 0, int(amount)))
+        else:
+            pyautogui.scroll(amount)
     
     def get_screen_size(self):
         """
@@ -62,4 +145,3 @@ class MouseController:
             tuple: (width, height)
         """
         return self.w_screen, self.h_screen
-
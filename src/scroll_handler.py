@@ -3,8 +3,8 @@ Scroll handler with progressive speed control.
 Manages scroll state and calculates scroll speeds based on hand position.
 """
 
-import math
 import time
+import numpy as np
 from .config import (
     CAMERA_HEIGHT, BASE_SCROLL_SENSITIVITY, MAX_SCROLL_SENSITIVITY,
     SCROLL_DELAY, SCROLL_HISTORY_LENGTH, SCROLL_BOOST_MULTIPLIER,
@@ -20,9 +20,28 @@ class ScrollHandler:
     def __init__(self):
         """Initialize scroll handler with default state."""
         self.scroll_mode = False
-        self.scroll_history = []
         self.last_scroll_time = 0
         self.history_length = SCROLL_HISTORY_LENGTH
+        
+        # Scroll zone geometry only depends on the camera height
+        self._n_height = int(CAMERA_HEIGHT * SCROLL_NEUTRAL_ZONE_HEIGHT_RATIO)
+        self._n_top = (CAMERA_HEIGHT - self._n_height) // 2
+        self._n_bot = (CAMERA_HEIGHT + self._n_height) // 2
+        self._inv_top = 1.0 / self._n_top
+        self._inv_bot = 1.0 / (CAMERA_HEIGHT - self._n_bot)
+        self._range = MAX_SCROLL_SENSITIVITY - BASE_SCROLL_SENSITIVITY
+        self._zones = (self._n_top, self._n_bot, self._n_height)
+        
+        # Ring buffer of recent scroll amounts with a running sum
+        self._buf = np.zeros(self.history_length)
+        self._reset_history()
+    
+    def _reset_history(self):
+        """Clear the scroll smoothing history."""
+        self._buf[:] = 0.0
+        self._idx = 0
+        self._count = 0
+        self._sum = 0.0
     
     def smooth_scroll(self, current_amount):
         """
@@ -34,10 +53,11 @@ class ScrollHandler:
         Returns:
             Smoothed scroll amount
         """
-        self.scroll_history.append(current_amount)
-        if len(self.scroll_history) > self.history_length:
-            self.scroll_history.pop(0)
-        return sum(self.scroll_history) / len(self.scroll_history)
+        self._sum += current_amount - self._buf[self._idx]
+        self._buf[self._idx] = current_amount
+        self._idx = (self._idx + 1) % self.history_length
+        self._count = min(self._count + 1, self.history_length)
+        return self._sum / self._count
     
     def get_progressive_speed(self, y_pos):
         """
@@ -49,30 +69,23 @@ class ScrollHandler:
         Returns:
             Scroll speed (negative for up, positive for down, 0 for neutral)
         """
-        # Define the neutral zone in the center (no scrolling)
-        neutral_zone_height = int(CAMERA_HEIGHT * SCROLL_NEUTRAL_ZONE_HEIGHT_RATIO)
-        neutral_top = (CAMERA_HEIGHT - neutral_zone_height) // 2
-        neutral_bottom = (CAMERA_HEIGHT + neutral_zone_height) // 2
-        
         # Check if in neutral zone
-        if neutral_top <= y_pos <= neutral_bottom:
+        if self._n_top <= y_pos <= self._n_bot:
             return 0
         
         # Calculate speed for top zone (scrolling up)
-        if y_pos < neutral_top:
+        if y_pos < self._n_top:
             # Normalized distance from neutral edge (0 to 1)
-            dist_from_neutral = (neutral_top - y_pos) / neutral_top
-            # Apply exponential curve for progressive speed
-            speed_factor = math.pow(dist_from_neutral, 2)  # Quadratic curve
-            return -(BASE_SCROLL_SENSITIVITY) + (MAX_SCROLL_SENSITIVITY - BASE_SCROLL_SENSITIVITY) * speed_factor
+            dist_from_neutral = (self._n_top - y_pos) * self._inv_top
+            # Quadratic curve for progressive speed
+            return -(BASE_SCROLL_SENSITIVITY) + self._range * dist_from_neutral * dist_from_neutral
         
         # Calculate speed for bottom zone (scrolling down)
         else:
             # Normalized distance from neutral edge (0 to 1)
-            dist_from_neutral = (y_pos - neutral_bottom) / (CAMERA_HEIGHT - neutral_bottom)
-            # Apply exponential curve for progressive speed
-            speed_factor = math.pow(dist_from_neutral, 2)  # Quadratic curve
-            return BASE_SCROLL_SENSITIVITY + (MAX_SCROLL_SENSITIVITY - BASE_SCROLL_SENSITIVITY) * speed_factor
+            dist_from_neutral = (y_pos - self._n_bot) * self._inv_bot
+            # Quadratic curve for progressive speed
+            return BASE_SCROLL_SENSITIVITY + self._range * dist_from_neutral * dist_from_neutral
     
     def get_scroll_zones(self):
         """
@@ -81,10 +94,7 @@ class ScrollHandler:
         Returns:
             tuple: (neutral_top, neutral_bottom, neutral_zone_height)
         """
-        neutral_zone_height = int(CAMERA_HEIGHT * SCROLL_NEUTRAL_ZONE_HEIGHT_RATIO)
-        neutral_top = (CAMERA_HEIGHT - neutral_zone_height) // 2
-        neutral_bottom = (CAMERA_HEIGHT + neutral_zone_height) // 2
-        return neutral_top, neutral_bottom, neutral_zone_height
+        return self._zones
     
     def should_scroll(self, scroll_speed):
         """
@@ -107,7 +117,7 @@ class ScrollHandler:
     def activate_scroll_mode(self):
         """Activate scroll mode and reset history."""
         self.scroll_mode = True
-        self.scroll_history = []
+        self._reset_history()
     
     def deactivate_scroll_mode(self):
         """Deactivate scroll mode."""
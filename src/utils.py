@@ -1,5 +1,5 @@
 """
-Utility functions for FPS calculation and visual feedback.
+Utility functions for FPS calculation, frame pacing and visual feedback.
 """
 
 import cv2
@@ -49,3 +49,27 @@ class FPSCounter:
                    cv2.FONT_HERSHEY_PLAIN, FPS_FONT_SCALE, FPS_COLOR, FPS_THICKNESS)
         return img
 
+
+class FrameLimiter:
+    """
+    Caps the main loop rate to avoid busy-spinning on repeated frames.
+    """
+    
+    def __init__(self, target_fps):
+        """
+        Initialize frame limiter.
+        
+        Args:
+            target_fps: Maximum loop iterations per second
+        """
+        self.target_dt = 1.0 / target_fps
+        self.t_next = time.monotonic()
+    
+    def wait(self):
+        """Sleep until the next frame slot, resyncing if the loop fell behind."""
+        self.t_next += self.target_dt
+        sleep = self.t_next - time.monotonic()
+        if sleep > 0:
+            time.sleep(sleep)
+        else:
+            self.t_next = time.monotonic()